@@ -1,13 +1,16 @@
 """Authentication management for Kestra CLI."""
 
-import json
+import copy
 import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AuthContext:
     """Represents an authentication context."""
     name: str
@@ -34,27 +37,80 @@ class AuthManager:
             self.config_dir = Path.home() / ".kestra"
         
         self.config_file = self.config_dir / "config"
-        self._ensure_config_dir()
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_mtime: Optional[int] = None
+        self._default_context: Optional[AuthContext] = None
+        self._default_context_config: Optional[Dict[str, Any]] = None
     
     def _ensure_config_dir(self):
         """Ensure the config directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file."""
-        if not self.config_file.exists():
+        """Load configuration from file.
+        
+        Returns a copy that callers may modify and pass to save_config.
+        """
+        return copy.deepcopy(self._read_config())
+    
+    def _read_config(self) -> Dict[str, Any]:
+        """Return the parsed config, shared and not to be modified.
+        
+        The parsed config is cached and only re-read when the file's
+        modification time changes.
+        """
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            self._config_cache = None
+            self._config_mtime = None
             return {"contexts": {}, "default_context": None}
         
+        if self._config_cache is not None and mtime == self._config_mtime:
+            return self._config_cache
+        
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(self.config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             return {"contexts": {}, "default_context": None}
+        
+        self._config_cache = config
+        self._config_mtime = mtime
+        return config
     
     def save_config(self, config: Dict[str, Any]):
-        """Save configuration to file."""
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        """Save configuration to file.
+        
+        The config is written to a temporary file and renamed over the
+        original, so an interrupted save never leaves a truncated config.
+        The file keeps its existing permissions; a new one is created
+        readable by the owner only, as it holds credentials.
+        """
+        self._ensure_config_dir()
+        try:
+            mode = os.stat(self.config_file).st_mode & 0o777
+        except OSError:
+            mode = 0o600
+        
+        # A unique temporary file per save, so concurrent saves never share one;
+        # mkstemp creates it readable by the owner only
+        fd, tmp_name = tempfile.mkstemp(dir=self.config_dir, prefix=".config.")
+        try:
+            with open(fd, 'wb') as f:
+                os.fchmod(f.fileno(), mode)
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+            os.replace(tmp_name, self.config_file)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        
+        # Cache a copy, so later changes by the caller don't leak into it
+        self._config_cache = copy.deepcopy(config)
+        self._config_mtime = mtime
     
     def add_context(self, context: AuthContext):
         """Add or update an authentication context."""
@@ -78,8 +134,11 @@ class AuthManager:
         Returns:
             AuthContext if found, None otherwise.
         """
-        config = self.load_config()
-        
+        return self._context_from_config(self._read_config(), name)
+    
+    @staticmethod
+    def _context_from_config(config: Dict[str, Any], name: Optional[str]) -> Optional[AuthContext]:
+        """Build a context from a parsed config. See get_context."""
         if name is None:
             name = config.get("default_context")
             if not name:
@@ -99,6 +158,19 @@ class AuthManager:
             password=context_data.get("password"),
         )
     
+    @property
+    def default_context(self) -> Optional[AuthContext]:
+        """The default authentication context, or None if none is set.
+        
+        The config file is re-checked on every access, but the context is
+        only rebuilt after the config has been saved or re-read.
+        """
+        config = self._read_config()
+        if config is not self._default_context_config:
+            self._default_context = self._context_from_config(config, None)
+            self._default_context_config = config
+        return self._default_context
+    
     def set_default_context(self, name: str):
         """Set the default context."""
         config = self.load_config()
@@ -110,7 +182,7 @@ class AuthManager:
     
     def list_contexts(self) -> Dict[str, AuthContext]:
         """List all available contexts."""
-        config = self.load_config()
+        config = self._read_config()
         contexts = {}
         
         for name, data in config.get("contexts", {}).items():
@@ -134,3 +206,14 @@ class AuthManager:
             if config.get("default_context") == name:
                 config["default_context"] = None
             self.save_config(config)
+
+
+_DEFAULT_AUTH_MANAGER: Optional[AuthManager] = None
+
+
+def get_default_auth_manager() -> AuthManager:
+    """Get the process-wide AuthManager, creating it on first use."""
+    global _DEFAULT_AUTH_MANAGER
+    if _DEFAULT_AUTH_MANAGER is None:
+        _DEFAULT_AUTH_MANAGER = AuthManager()
+    return _DEFAULT_AUTH_MANAGER
@@ -0,0 +1,467 @@
+"""Base API client for Kestra."""
+
+import asyncio
+import email.utils
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import httpx
+import orjson
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, Tuple, Hashable, Iterator
+from .auth import AuthManager, AuthContext, get_default_auth_manager
+
+
+# Connection pool tuning shared by every HTTP client, so sequential requests
+# to the same host reuse a warm (HTTP/2) connection.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0)
+
+# Short-lived cache of idempotent responses, so repeated lookups of the same
+# resource within one command don't hit the server again
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_TTL = 2.0
+_CACHEABLE_METHODS = {"GET", "HEAD"}
+
+# Retry policy for rate limiting and transient server errors. POST is not
+# idempotent, so it is only retried when the server signals that it did not
+# process the request: 429, or 503 with a Retry-After header.
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF_FACTOR = 0.5
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+_RETRY_POST_STATUSES = frozenset({429})
+_RETRY_POST_STATUSES_WITH_RETRY_AFTER = frozenset({503})
+
+# Longest wait before a retry; a server asking for more is not retried
+_RETRY_MAX_DELAY = 30.0
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body."""
+    return orjson.loads(response.content)
+
+
+def _auth_kwargs(context: AuthContext) -> Dict[str, Any]:
+    """Build the httpx client arguments for a context."""
+    headers = {}
+    auth = None
+    
+    # Add authentication header
+    if context.auth_method == "token" and context.token:
+        headers["Authorization"] = f"Bearer {context.token}"
+    elif context.auth_method == "username_password":
+        # For basic auth, we'll use httpx's auth parameter
+        auth = (context.username, context.password) if context.username and context.password else None
+    
+    return {"base_url": context.host, "headers": headers, "auth": auth, "timeout": 30.0}
+
+
+def _context_key(context: AuthContext) -> Tuple[Optional[str], ...]:
+    """Key used to cache HTTP clients per host and credentials."""
+    return (context.host, context.auth_method, context.token, context.username, context.password)
+
+
+def _params_key(params: Any) -> Optional[Hashable]:
+    """Hashable form of request params, or None if they can't be cached."""
+    if params is None:
+        return ()
+    items = params.items() if isinstance(params, dict) else params
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Delay requested by the server's Retry-After header, in seconds."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _should_retry(request: httpx.Request, response: httpx.Response, attempt: int) -> bool:
+    """Whether a response is a transient failure worth retrying."""
+    if attempt >= _RETRY_TOTAL:
+        return False
+    
+    status = response.status_code
+    retry_after = _retry_after(response)
+    if request.method in _RETRY_METHODS:
+        retryable = status in _RETRY_STATUSES
+    elif request.method == "POST":
+        retryable = status in _RETRY_POST_STATUSES or (
+            status in _RETRY_POST_STATUSES_WITH_RETRY_AFTER and retry_after is not None
+        )
+    else:
+        retryable = False
+    
+    return retryable and (retry_after is None or retry_after <= _RETRY_MAX_DELAY)
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Delay before the given retry attempt.
+    
+    Honours the server's Retry-After header, falling back to exponential
+    backoff.
+    """
+    delay = _retry_after(response)
+    if delay is None:
+        delay = _RETRY_BACKOFF_FACTOR * (2 ** attempt)
+    return min(delay, _RETRY_MAX_DELAY)
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """Transport wrapper that retries transient server errors with backoff."""
+    
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._transport.handle_request(request)
+            if not _should_retry(request, response, attempt):
+                return response
+            response.close()
+            time.sleep(_retry_delay(attempt, response))
+            attempt += 1
+    
+    def close(self):
+        self._transport.close()
+
+
+class _AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async transport wrapper that retries transient server errors with backoff."""
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if not _should_retry(request, response, attempt):
+                return response
+            await response.aclose()
+            await asyncio.sleep(_retry_delay(attempt, response))
+            attempt += 1
+    
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def _raise_api_error(e: httpx.HTTPError):
+    """Re-raise an httpx error with the response body included in the message."""
+    # Add more detailed error information
+    error_msg = f"API request failed: {e}"
+    if hasattr(e, 'response') and e.response is not None:
+        try:
+            error_body = e.response.text
+            error_msg += f"\nResponse body: {error_body}"
+        except:
+            pass
+    if isinstance(e, httpx.HTTPStatusError):
+        # Keep the response attached so callers can branch on the status code
+        raise httpx.HTTPStatusError(error_msg, request=e.request, response=e.response)
+    raise httpx.HTTPError(error_msg)
+
+
+class _BaseAPIClient(ABC):
+    """Context resolution and per-context HTTP client caching shared by the
+    sync and async API clients."""
+    
+    def __init__(self, auth_manager: Optional[AuthManager] = None):
+        """Initialize the API client.
+        
+        Args:
+            auth_manager: AuthManager instance. If None, uses the shared default one.
+        """
+        self.auth_manager = auth_manager or get_default_auth_manager()
+        self._clients: Dict[Tuple[Optional[str], ...], Any] = {}
+        self._base_urls: Dict[Any, str] = {}
+        self._clients_lock = threading.Lock()
+    
+    def resolve_context(self, context: Optional[AuthContext] = None) -> AuthContext:
+        """Return the given auth context, or the default one if None.
+        
+        Raises:
+            ValueError: If no context is given and no default is configured
+        """
+        if context is None:
+            context = self.auth_manager.default_context
+            if context is None:
+                raise ValueError("No authentication context found. Please configure authentication.")
+        return context
+    
+    @abstractmethod
+    def _create_client(self, context: AuthContext):
+        """Create the HTTP client used for a context."""
+    
+    def _get_client(self, context: Optional[AuthContext] = None):
+        """Get or create an HTTP client with authentication.
+        
+        Clients are cached per host and credentials, so requests made with
+        different contexts never share a base URL or auth headers. Safe to
+        call from several threads; only one client is created per context.
+        
+        Args:
+            context: Auth context to use. If None, uses default context.
+        
+        Returns:
+            Configured httpx client instance.
+        """
+        context = self.resolve_context(context)
+        
+        key = _context_key(context)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create_client(context)
+                self._base_urls[client] = str(client.base_url).rstrip('/')
+                self._clients[key] = client
+        return client
+
+
+class KestraAPIClient(_BaseAPIClient):
+    """Base API client for Kestra."""
+    
+    def __init__(self, auth_manager: Optional[AuthManager] = None):
+        """Initialize the API client.
+        
+        Args:
+            auth_manager: AuthManager instance. If None, uses the shared default one.
+        """
+        super().__init__(auth_manager)
+        self._cache: TTLCache = TTLCache(maxsize=_RESPONSE_CACHE_SIZE, ttl=_RESPONSE_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+    
+    def _create_client(self, context: AuthContext) -> httpx.Client:
+        return httpx.Client(
+            **_auth_kwargs(context),
+            transport=_RetryTransport(httpx.HTTPTransport(http2=True, limits=_POOL_LIMITS, retries=1))
+        )
+    
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        context: Optional[AuthContext] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make an HTTP request to the Kestra API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            context: Auth context to use
+            **kwargs: Additional arguments for httpx request
+        
+        Returns:
+            httpx.Response object
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        client = self._get_client(context)
+        
+        # Build full URL, handling trailing slashes properly
+        path = '/' + endpoint.lstrip('/')
+        url = self._base_urls[client] + path
+        
+        cache_key = None
+        if method in _CACHEABLE_METHODS:
+            if kwargs.keys() <= {"params"}:
+                params_key = _params_key(kwargs.get("params"))
+                if params_key is not None:
+                    cache_key = (client, method, path, params_key)
+                    with self._cache_lock:
+                        cached = self._cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+        else:
+            self._invalidate(path)
+        
+        try:
+            response = client.request(method, url, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            _raise_api_error(e)
+        
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = response
+        return response
+    
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        context: Optional[AuthContext] = None,
+        **kwargs
+    ) -> Iterator[httpx.Response]:
+        """Make a streaming HTTP request to the Kestra API.
+        
+        The response body is not read up front; iterate it with
+        `response.iter_bytes()` inside the `with` block. Streamed responses
+        are never cached.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            context: Auth context to use
+            **kwargs: Additional arguments for httpx request
+        
+        Yields:
+            httpx.Response object
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        client = self._get_client(context)
+        url = self._base_urls[client] + '/' + endpoint.lstrip('/')
+        
+        try:
+            with client.stream(method, url, **kwargs) as response:
+                if response.is_error:
+                    # Load the body so the error message can include it
+                    response.read()
+                response.raise_for_status()
+                yield response
+        except httpx.HTTPError as e:
+            _raise_api_error(e)
+    
+    def _invalidate(self, path: str):
+        """Drop cached responses for a resource and its parents or children."""
+        with self._cache_lock:
+            for key in [k for k in self._cache.keys() if k[2].startswith(path) or path.startswith(k[2])]:
+                self._cache.pop(key, None)
+    
+    def cache_clear(self):
+        """Drop all cached responses, so the next reads hit the server."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def get(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a GET request."""
+        return self._make_request("GET", endpoint, context, **kwargs)
+    
+    def head(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a HEAD request."""
+        return self._make_request("HEAD", endpoint, context, **kwargs)
+    
+    def post(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a POST request."""
+        return self._make_request("POST", endpoint, context, **kwargs)
+    
+    def put(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a PUT request."""
+        return self._make_request("PUT", endpoint, context, **kwargs)
+    
+    def delete(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a DELETE request."""
+        return self._make_request("DELETE", endpoint, context, **kwargs)
+    
+    def close(self):
+        """Close all cached HTTP clients."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+        self._base_urls.clear()
+        self.cache_clear()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncKestraAPIClient(_BaseAPIClient):
+    """Asynchronous API client for Kestra, used to run many requests concurrently."""
+    
+    def _create_client(self, context: AuthContext) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            **_auth_kwargs(context),
+            transport=_AsyncRetryTransport(
+                httpx.AsyncHTTPTransport(http2=True, limits=_POOL_LIMITS, retries=1)
+            )
+        )
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        context: Optional[AuthContext] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make an HTTP request to the Kestra API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            context: Auth context to use
+            **kwargs: Additional arguments for httpx request
+        
+        Returns:
+            httpx.Response object
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        client = self._get_client(context)
+        
+        url = self._base_urls[client] + '/' + endpoint.lstrip('/')
+        
+        try:
+            response = await client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            _raise_api_error(e)
+    
+    async def get(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a GET request."""
+        return await self._make_request("GET", endpoint, context, **kwargs)
+    
+    async def head(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a HEAD request."""
+        return await self._make_request("HEAD", endpoint, context, **kwargs)
+    
+    async def post(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a POST request."""
+        return await self._make_request("POST", endpoint, context, **kwargs)
+    
+    async def put(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a PUT request."""
+        return await self._make_request("PUT", endpoint, context, **kwargs)
+    
+    async def delete(self, endpoint: str, context: Optional[AuthContext] = None, **kwargs) -> httpx.Response:
+        """Make a DELETE request."""
+        return await self._make_request("DELETE", endpoint, context, **kwargs)
+    
+    async def close(self):
+        """Close all cached HTTP clients."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._base_urls.clear()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
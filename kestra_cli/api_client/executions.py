@@ -0,0 +1,223 @@
+"""Executions API endpoints for Kestra."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable
+from .client import KestraAPIClient, AsyncKestraAPIClient, parse_json
+from .auth import AuthContext
+
+
+# API endpoint templates
+_KILL_BY_QUERY_ENDPOINT = "/api/v1/{tenant}/executions/kill/by-query"
+_TRIGGER_ENDPOINT = "/api/v1/{tenant}/executions/{namespace}/{flow_id}"
+_EXECUTION_ENDPOINT = "/api/v1/{tenant}/executions/{execution_id}"
+_KILL_ENDPOINT = "/api/v1/{tenant}/executions/{execution_id}/kill"
+
+# Maximum number of kill requests in flight for kill_executions
+_KILL_CONCURRENCY = 16
+
+
+class ExecutionsAPI:
+    """API client for executions endpoints."""
+    
+    def __init__(self, client: KestraAPIClient):
+        """Initialize the executions API client.
+        
+        Args:
+            client: KestraAPIClient instance
+        """
+        self.client = client
+    
+    def kill_by_query(
+        self,
+        state: Optional[List[str]] = None,
+        namespace: Optional[str] = None,
+        flow_id: Optional[str] = None,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Dict[str, Any]:
+        """Kill executions matching the query parameters.
+        
+        Args:
+            state: List of execution states to filter by (e.g., ['RUNNING'])
+            namespace: Optional namespace to filter executions
+            flow_id: Optional flow ID to filter executions
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            Response dictionary with kill operation results
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        # Build query parameters; each state is sent as a repeated `state` key
+        params = [('state', s) for s in state or ()]
+        if namespace:
+            params.append(('namespace', namespace))
+        if flow_id:
+            params.append(('flowId', flow_id))
+        
+        endpoint = _KILL_BY_QUERY_ENDPOINT.format(tenant=tenant)
+        response = self.client.delete(endpoint, context, params=params)
+        return parse_json(response)
+    
+    def kill_execution(
+        self,
+        execution_id: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ):
+        """Kill a single execution.
+        
+        Args:
+            execution_id: Execution ID
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _KILL_ENDPOINT.format(tenant=tenant, execution_id=execution_id)
+        self.client.delete(endpoint, context)
+    
+    def kill_executions(
+        self,
+        execution_ids: Iterable[str],
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> List[Optional[Exception]]:
+        """Kill many executions concurrently.
+        
+        Requests are sent from a thread pool over the shared HTTP client.
+        
+        Args:
+            execution_ids: Execution IDs to kill
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            One entry per input, in order: None if the execution was killed,
+            or the exception raised for that execution.
+        """
+        context = self.client.resolve_context(context)
+        
+        def kill(execution_id: str) -> Optional[Exception]:
+            try:
+                self.kill_execution(execution_id, tenant, context)
+            except Exception as e:
+                return e
+            return None
+        
+        with ThreadPoolExecutor(max_workers=_KILL_CONCURRENCY) as executor:
+            return list(executor.map(kill, execution_ids))
+    
+    def trigger_execution(
+        self,
+        namespace: str,
+        flow_id: str,
+        wait: bool = False,
+        inputs: Optional[Dict[str, Any]] = None,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Dict[str, Any]:
+        """Trigger a flow execution.
+        
+        Args:
+            namespace: Namespace of the flow
+            flow_id: Flow ID to execute
+            wait: If True, wait for execution to complete before returning
+            inputs: Optional inputs for the flow execution
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            Execution dictionary
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        # Build query parameters
+        params = {}
+        if wait:
+            params['wait'] = 'true'
+        
+        endpoint = _TRIGGER_ENDPOINT.format(tenant=tenant, namespace=namespace, flow_id=flow_id)
+        
+        # If inputs are provided, send them as JSON body
+        if inputs:
+            response = self.client.post(endpoint, context, params=params, json=inputs)
+        else:
+            response = self.client.post(endpoint, context, params=params)
+        
+        return parse_json(response)
+    
+    def get_execution(
+        self,
+        execution_id: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Dict[str, Any]:
+        """Get execution details by ID.
+        
+        Args:
+            execution_id: Execution ID
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            Execution dictionary
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _EXECUTION_ENDPOINT.format(tenant=tenant, execution_id=execution_id)
+        response = self.client.get(endpoint, context)
+        return parse_json(response)
+
+
+class AsyncExecutionsAPI:
+    """Async API client for executions endpoints."""
+    
+    def __init__(self, client: AsyncKestraAPIClient):
+        """Initialize the async executions API client.
+        
+        Args:
+            client: AsyncKestraAPIClient instance
+        """
+        self.client = client
+    
+    async def get_execution(
+        self,
+        execution_id: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Dict[str, Any]:
+        """Get execution details by ID. See ExecutionsAPI.get_execution."""
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _EXECUTION_ENDPOINT.format(tenant=tenant, execution_id=execution_id)
+        response = await self.client.get(endpoint, context)
+        return parse_json(response)
@@ -0,0 +1,449 @@
+"""Flows API endpoints for Kestra."""
+
+import asyncio
+import re
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple, Union, Iterator
+import httpx
+from .client import KestraAPIClient, AsyncKestraAPIClient, parse_json
+from .auth import AuthContext
+
+
+# API endpoint templates
+_FLOWS_ENDPOINT = "/api/v1/{tenant}/flows"
+_NAMESPACE_FLOWS_ENDPOINT = "/api/v1/{tenant}/flows/{namespace}"
+_FLOW_ENDPOINT = "/api/v1/{tenant}/flows/{namespace}/{flow_id}"
+
+# YAML loader, resolved on first use since most flows never need a full parse
+_LOADER = None
+
+# Top-level `id:` / `namespace:` keys with a plain (unquoted) scalar value
+_TOP_LEVEL_KEY_RE = re.compile(r'^(id|namespace):[ \t]+([A-Za-z0-9][\w.-]*)(?:[ \t]+#[^\r\n]*)?[ \t]*\r?$', re.M)
+_ANY_TOP_LEVEL_KEY_RE = re.compile(r'^(?:id|namespace)[ \t]*:', re.M)
+_TOP_LEVEL_KEY_BYTES_RE = re.compile(_TOP_LEVEL_KEY_RE.pattern.encode(), re.M)
+_ANY_TOP_LEVEL_KEY_BYTES_RE = re.compile(_ANY_TOP_LEVEL_KEY_RE.pattern.encode(), re.M)
+
+# Plain scalars that YAML resolves to something other than a string. Values
+# starting with a digit may be numbers or dates (012, 1_000, 1.50, 2024-01-01)
+# and are always left to the YAML parser.
+_NON_STRING_SCALARS = {"null", "true", "false", "yes", "no", "on", "off"}
+
+# Maximum number of concurrent requests issued by bulk operations
+_BULK_CONCURRENCY = 16
+
+_YAML_HEADERS = {"Content-Type": "application/x-yaml"}
+
+
+def _yaml_loader():
+    """Import PyYAML and return the fastest safe loader available."""
+    global _LOADER
+    if _LOADER is None:
+        import yaml
+        # Use the libyaml-backed loader when PyYAML was built with it
+        _LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _LOADER
+
+
+def _prescan_flow_yaml(yaml_content: Union[str, bytes]) -> Optional[Tuple[str, str]]:
+    """Extract namespace and flow ID without parsing the whole document.
+    
+    Returns None when the keys are missing, duplicated or not simple
+    strings, in which case the content must be parsed as YAML.
+    """
+    if isinstance(yaml_content, bytes):
+        key_re, any_key_re = _TOP_LEVEL_KEY_BYTES_RE, _ANY_TOP_LEVEL_KEY_BYTES_RE
+    else:
+        key_re, any_key_re = _TOP_LEVEL_KEY_RE, _ANY_TOP_LEVEL_KEY_RE
+    
+    matches = key_re.findall(yaml_content)
+    if len(matches) != 2 or len(any_key_re.findall(yaml_content)) != 2:
+        return None
+    
+    if isinstance(yaml_content, bytes):
+        matches = [(key.decode(), value.decode()) for key, value in matches]
+    
+    values = dict(matches)
+    if len(values) != 2 or any(v[0].isdigit() or v.lower() in _NON_STRING_SCALARS for v in values.values()):
+        return None
+    
+    return values["namespace"], values["id"]
+
+
+def parse_flow_yaml(yaml_content: Union[str, bytes]) -> Tuple[str, str]:
+    """Parse YAML content and extract flow ID and namespace.
+    
+    Simple top-level `id` and `namespace` values are read directly; the
+    full YAML document is only parsed when they cannot be found that way.
+    
+    Args:
+        yaml_content: YAML content of the flow, as text or UTF-8 bytes
+    
+    Returns:
+        Tuple of (namespace, flow_id)
+    
+    Raises:
+        ValueError: If id or namespace is missing from the YAML
+        yaml.YAMLError: If the YAML is invalid
+    """
+    prescanned = _prescan_flow_yaml(yaml_content)
+    if prescanned is not None:
+        return prescanned
+    
+    import yaml
+    
+    try:
+        flow_data = yaml.load(yaml_content, Loader=_yaml_loader())
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML content: {e}")
+    
+    if not isinstance(flow_data, dict):
+        raise ValueError("YAML content must be a dictionary")
+    
+    flow_id = flow_data.get("id")
+    namespace = flow_data.get("namespace")
+    
+    if not flow_id:
+        raise ValueError("Flow YAML must contain an 'id' field")
+    if not namespace:
+        raise ValueError("Flow YAML must contain a 'namespace' field")
+    
+    return namespace, flow_id
+
+
+def _is_already_exists(response: httpx.Response) -> bool:
+    """Check whether a failed create response means the flow already exists."""
+    if response.status_code == 409:
+        return True
+    return response.status_code == 422 and "already exists" in response.text
+
+
+class _FlowUpload(NamedTuple):
+    """Request details for creating or updating a flow."""
+    namespace: str
+    flow_id: str
+    content: bytes
+    update_endpoint: str
+    create_endpoint: str
+
+
+def _prepare_upload(yaml_content: Union[str, bytes], tenant: str) -> _FlowUpload:
+    """Parse a flow's YAML and build the requests that upload it.
+    
+    Raises:
+        ValueError: If the YAML is invalid or lacks an id or namespace
+    """
+    namespace, flow_id = parse_flow_yaml(yaml_content)
+    
+    # Encode once; the same body may be sent twice (PUT, then POST)
+    if isinstance(yaml_content, str):
+        yaml_content = yaml_content.encode("utf-8")
+    
+    return _FlowUpload(
+        namespace=namespace,
+        flow_id=flow_id,
+        content=yaml_content,
+        update_endpoint=_FLOW_ENDPOINT.format(tenant=tenant, namespace=namespace, flow_id=flow_id),
+        create_endpoint=_FLOWS_ENDPOINT.format(tenant=tenant),
+    )
+
+
+def _create_error(e: httpx.HTTPStatusError, upload: _FlowUpload, override: bool) -> Exception:
+    """Map a failed create to the error to raise.
+    
+    Returns a ValueError if the flow already exists and override is off,
+    otherwise the original error.
+    """
+    if not override and _is_already_exists(e.response):
+        return ValueError(
+            f"Flow '{upload.flow_id}' already exists in namespace '{upload.namespace}'. "
+            "Use --override to update the existing flow."
+        )
+    return e
+
+
+class FlowsAPI:
+    """API client for flows endpoints."""
+    
+    def __init__(self, client: KestraAPIClient):
+        """Initialize the flows API client.
+        
+        Args:
+            client: KestraAPIClient instance
+        """
+        self.client = client
+    
+    def list_flows(
+        self,
+        namespace: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> List[Dict[str, Any]]:
+        """List flows in a namespace.
+        
+        Args:
+            namespace: Namespace to list flows from
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            List of flow dictionaries
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _NAMESPACE_FLOWS_ENDPOINT.format(tenant=tenant, namespace=namespace)
+        response = self.client.get(endpoint, context)
+        return parse_json(response)
+    
+    def list_flows_iter(
+        self,
+        namespace: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over flows in a namespace as the response is received.
+        
+        Unlike list_flows, the response is parsed incrementally so flows can
+        be consumed before the whole body has been downloaded.
+        
+        Args:
+            namespace: Namespace to list flows from
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Yields:
+            Flow dictionaries
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        import ijson
+        
+        endpoint = _NAMESPACE_FLOWS_ENDPOINT.format(tenant=tenant, namespace=namespace)
+        with self.client.stream("GET", endpoint, context) as response:
+            flows = ijson.sendable_list()
+            parser = ijson.items_coro(flows, "item", use_float=True)
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                yield from flows
+                del flows[:]
+            parser.close()
+            yield from flows
+    
+    def get_flow(
+        self,
+        namespace: str,
+        flow_id: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> Dict[str, Any]:
+        """Get a specific flow.
+        
+        Args:
+            namespace: Namespace of the flow
+            flow_id: Flow ID
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            Flow dictionary
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _FLOW_ENDPOINT.format(tenant=tenant, namespace=namespace, flow_id=flow_id)
+        response = self.client.get(endpoint, context)
+        return parse_json(response)
+    
+    def flow_exists(
+        self,
+        namespace: str,
+        flow_id: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> bool:
+        """Check if a flow exists.
+        
+        Args:
+            namespace: Namespace of the flow
+            flow_id: Flow ID
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+        
+        Returns:
+            True if the flow exists, False otherwise
+        
+        Raises:
+            httpx.HTTPError: If the API request fails for a reason other than
+                the flow not being found
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _FLOW_ENDPOINT.format(tenant=tenant, namespace=namespace, flow_id=flow_id)
+        try:
+            self.client.head(endpoint, context)
+            return True
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return False
+            raise
+    
+    def create_flow(
+        self,
+        yaml_content: Union[str, bytes],
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None,
+        override: bool = False
+    ) -> Dict[str, Any]:
+        """Create or update a flow from YAML content.
+        
+        Args:
+            yaml_content: YAML content of the flow, as text or UTF-8 bytes
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+            override: If True, updates the flow if it exists. If False, raises error if flow exists.
+        
+        Returns:
+            Created or updated flow dictionary
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+            ValueError: If flow exists and override is False
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        # Parse YAML to get namespace and flow ID
+        upload = _prepare_upload(yaml_content, tenant)
+        
+        if override:
+            # Update in place; only fall back to creating when the flow is missing
+            try:
+                response = self.client.put(upload.update_endpoint, context, content=upload.content, headers=_YAML_HEADERS)
+                return parse_json(response)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+        
+        # Create new flow, letting the server report an existing one
+        try:
+            response = self.client.post(upload.create_endpoint, context, content=upload.content, headers=_YAML_HEADERS)
+        except httpx.HTTPStatusError as e:
+            raise _create_error(e, upload, override)
+        
+        return parse_json(response)
+    
+    def create_flows_bulk(
+        self,
+        yaml_contents: List[Union[str, bytes]],
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None,
+        override: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create or update many flows concurrently.
+        
+        Args:
+            yaml_contents: YAML contents of the flows
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+            override: If True, updates flows that already exist
+        
+        Returns:
+            One entry per input, in order: the created or updated flow
+            dictionary, or the exception raised for that flow.
+        """
+        context = self.client.resolve_context(context)
+        
+        async def run() -> List[Union[Dict[str, Any], Exception]]:
+            semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+            
+            async with AsyncKestraAPIClient(self.client.auth_manager) as async_client:
+                flows_api = AsyncFlowsAPI(async_client)
+                
+                async def create(yaml_content: Union[str, bytes]) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await flows_api.create_flow(yaml_content, tenant, context, override)
+                
+                return await asyncio.gather(
+                    *(create(yaml_content) for yaml_content in yaml_contents),
+                    return_exceptions=True
+                )
+        
+        return asyncio.run(run())
+
+
+class AsyncFlowsAPI:
+    """Async API client for flows endpoints."""
+    
+    def __init__(self, client: AsyncKestraAPIClient):
+        """Initialize the async flows API client.
+        
+        Args:
+            client: AsyncKestraAPIClient instance
+        """
+        self.client = client
+    
+    async def list_flows(
+        self,
+        namespace: str,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None
+    ) -> List[Dict[str, Any]]:
+        """List flows in a namespace. See FlowsAPI.list_flows."""
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        endpoint = _NAMESPACE_FLOWS_ENDPOINT.format(tenant=tenant, namespace=namespace)
+        response = await self.client.get(endpoint, context)
+        return parse_json(response)
+    
+    async def create_flow(
+        self,
+        yaml_content: Union[str, bytes],
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None,
+        override: bool = False
+    ) -> Dict[str, Any]:
+        """Create or update a flow from YAML content. See FlowsAPI.create_flow."""
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        upload = _prepare_upload(yaml_content, tenant)
+        
+        if override:
+            try:
+                response = await self.client.put(upload.update_endpoint, context, content=upload.content, headers=_YAML_HEADERS)
+                return parse_json(response)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+        
+        try:
+            response = await self.client.post(upload.create_endpoint, context, content=upload.content, headers=_YAML_HEADERS)
+        except httpx.HTTPStatusError as e:
+            raise _create_error(e, upload, override)
+        
+        return parse_json(response)
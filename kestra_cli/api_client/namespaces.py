@@ -0,0 +1,126 @@
+"""Namespaces API endpoints for Kestra."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator
+from .client import KestraAPIClient, parse_json
+from .auth import AuthContext
+
+
+# API endpoint templates
+_SEARCH_ENDPOINT = "/api/v1/{tenant}/namespaces/search"
+
+
+class NamespacesAPI:
+    """API client for namespaces endpoints."""
+    
+    def __init__(self, client: KestraAPIClient):
+        """Initialize the namespaces API client.
+        
+        Args:
+            client: KestraAPIClient instance
+        """
+        self.client = client
+    
+    def list_namespaces(
+        self,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None,
+        query: Optional[str] = None,
+        page: int = 1,
+        size: int = 100
+    ) -> List[Dict[str, Any]]:
+        """List all namespaces in the Kestra instance.
+        
+        Args:
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+            query: Optional search query to filter namespaces
+            page: Page number (default: 1)
+            size: Page size (default: 100)
+        
+        Returns:
+            List of namespace dictionaries
+        
+        Raises:
+            httpx.HTTPError: If the API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        data = self._fetch_page(tenant, context, query, page, size)
+        
+        # Return the results from the paginated response
+        return data.get("results", [])
+    
+    def iter_namespaces(
+        self,
+        tenant: Optional[str] = None,
+        context: Optional[AuthContext] = None,
+        query: Optional[str] = None,
+        size: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all namespaces, following pagination.
+        
+        The next page is fetched in the background while the current one
+        is being consumed.
+        
+        Args:
+            tenant: Tenant name. If None, uses tenant from context
+            context: Auth context to use
+            query: Optional search query to filter namespaces
+            size: Page size (default: 100)
+        
+        Yields:
+            Namespace dictionaries
+        
+        Raises:
+            httpx.HTTPError: If an API request fails
+        """
+        context = self.client.resolve_context(context)
+        
+        if tenant is None:
+            tenant = context.tenant
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            seen = 0
+            future = executor.submit(self._fetch_page, tenant, context, query, page, size)
+            
+            while future is not None:
+                data = future.result()
+                results = data.get("results", [])
+                seen += len(results)
+                
+                total = data.get("total")
+                has_more = len(results) == size and (total is None or seen < total)
+                if has_more:
+                    page += 1
+                    future = executor.submit(self._fetch_page, tenant, context, query, page, size)
+                else:
+                    future = None
+                
+                yield from results
+    
+    def _fetch_page(
+        self,
+        tenant: str,
+        context: Optional[AuthContext],
+        query: Optional[str],
+        page: int,
+        size: int
+    ) -> Dict[str, Any]:
+        """Fetch one raw page of the namespaces search endpoint."""
+        endpoint = _SEARCH_ENDPOINT.format(tenant=tenant)
+        
+        # Build query parameters
+        params = {
+            "page": page,
+            "size": size
+        }
+        if query:
+            params["q"] = query
+        
+        response = self.client.get(endpoint, context, params=params)
+        return parse_json(response)
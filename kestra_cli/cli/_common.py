@@ -0,0 +1,103 @@
+"""Helpers shared by the CLI command modules."""
+
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from rich.style import Style
+from rich.text import Text
+
+from ._console import console
+
+
+# Output styles, built once instead of parsing markup on every print
+BOLD = Style(bold=True)
+CYAN = Style(color="cyan")
+DIM = Style(dim=True)
+GREEN = Style(color="green")
+RED = Style(color="red")
+YELLOW = Style(color="yellow")
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """Get the API client shared by all commands run in this process."""
+    from ..api_client.client import KestraAPIClient
+    
+    return KestraAPIClient()
+
+
+@lru_cache(maxsize=8)
+def build_temp_context(host: Optional[str], tenant: Optional[str], token: Optional[str]):
+    """Build an auth context from --host/--token options.
+    
+    Returns:
+        AuthContext, or None if neither a host nor a token was given.
+    """
+    if not (host or token):
+        return None
+    
+    from ..api_client.auth import AuthContext
+    
+    return AuthContext(
+        name="temp",
+        host=host or "http://localhost:8080",
+        tenant=tenant or "main",
+        auth_method="token",
+        token=token
+    )
+
+
+def field(label: str, value: Any) -> Text:
+    """Build a "Label: value" output line with the label highlighted."""
+    return Text.assemble((f"{label}:", CYAN), " ", str(value))
+
+
+def format_json(data) -> str:
+    """Serialize data as indented JSON for output."""
+    import orjson
+    
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def print_json(data):
+    """Print data as indented JSON.
+    
+    The text is written as-is: no markup parsing, highlighting or line
+    wrapping, so the output always stays valid JSON.
+    """
+    console.out(format_json(data), highlight=False)
+
+
+def run_batch(api, methods: Dict[str, str], cmd: str, context=None, tenant: Optional[str] = None) -> int:
+    """Call an API method once per JSON line read from stdin.
+    
+    Each non-empty line must be a JSON object holding the keyword arguments
+    of the method mapped to `cmd`; `tenant`, if given, is used for lines
+    that don't set their own. Results are written to stdout as JSON lines
+    in input order; a failed line yields `{"error": "..."}` instead.
+    
+    Returns:
+        Number of lines that failed.
+    """
+    import orjson
+    
+    method = getattr(api, methods[cmd])
+    out = sys.stdout.buffer
+    failures = 0
+    
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            kwargs = orjson.loads(line)
+            if tenant is not None:
+                kwargs.setdefault("tenant", tenant)
+            result = method(**kwargs, context=context)
+        except Exception as e:
+            result = {"error": str(e)}
+            failures += 1
+        out.write(orjson.dumps(result) + b"\n")
+        out.flush()
+    
+    return failures
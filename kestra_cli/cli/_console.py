@@ -0,0 +1,6 @@
+"""Console shared by all CLI modules."""
+
+from rich.console import Console
+
+
+console = Console()
@@ -0,0 +1,348 @@
+"""CLI commands for executions."""
+
+import re
+import typer
+from typing import List, Optional
+from rich.text import Text
+
+from ._common import BOLD, CYAN, GREEN, RED, YELLOW, get_client, build_temp_context, field, print_json, run_batch
+from ._console import console
+
+
+app = typer.Typer()
+
+# ISO-8601 durations expressed in seconds only (e.g. PT0.123S)
+_PT_SECONDS_RE = re.compile(r'^PT(\d+(?:\.\d+)?)S$')
+
+# Operations accepted by `executions batch`, mapped to ExecutionsAPI methods
+_BATCH_METHODS = {
+    "get": "get_execution",
+    "run": "trigger_execution",
+    "kill": "kill_execution",
+    "kill-by-query": "kill_by_query",
+}
+
+
+@app.command()
+def kill_running(
+    namespace: Optional[str] = typer.Option(None, "--namespace", "-n", help="Filter by namespace"),
+    flow_id: Optional[str] = typer.Option(None, "--flow-id", "-f", help="Filter by flow ID (requires --namespace)"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format (table or json)")
+):
+    """Kill all executions in RUNNING state.
+    
+    This command kills all running executions. You can optionally filter by
+    namespace and/or flow ID to target specific executions.
+    
+    Note: If you use --flow-id, you must also provide --namespace, as flow IDs
+    are only unique within a namespace.
+    """
+    try:
+        # Validate that namespace is provided if flow_id is specified
+        if flow_id and not namespace:
+            console.print(Text("Error: --namespace is required when using --flow-id", style=RED))
+            console.print(Text("Flow IDs are only unique within a namespace.", style=YELLOW))
+            raise typer.Exit(1)
+        
+        from ..api_client.executions import ExecutionsAPI
+        
+        # Initialize API client
+        client = get_client()
+        
+        # Create temporary context if credentials provided via CLI
+        context = build_temp_context(host, tenant, token)
+        
+        # Kill executions
+        executions_api = ExecutionsAPI(client)
+        result = executions_api.kill_by_query(
+            state=["RUNNING"],
+            namespace=namespace,
+            flow_id=flow_id,
+            tenant=tenant,
+            context=context
+        )
+        
+        if output == "json":
+            print_json(result)
+        else:
+            # Display success message
+            lines = [Text("✓ Kill request sent successfully!", style=GREEN)]
+            
+            # Build filter description
+            filters = []
+            if namespace:
+                filters.append(f"namespace: {namespace}")
+            if flow_id:
+                filters.append(f"flow ID: {flow_id}")
+            
+            if filters:
+                lines.append(field("Filters", ', '.join(filters)))
+            else:
+                lines.append(field("Filters", "None (all running executions)"))
+            
+            lines.append(field("State", "RUNNING"))
+            
+            # Display result details if available
+            if isinstance(result, dict):
+                if 'count' in result:
+                    lines.append(field("Executions killed", result['count']))
+                elif 'message' in result:
+                    lines.append(field("Message", result['message']))
+            
+            console.print(Text("\n").join(lines))
+    
+    except Exception as e:
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
+
+@app.command()
+def kill(
+    execution_ids: List[str] = typer.Argument(..., help="Execution IDs to kill"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format (table or json)")
+):
+    """Kill one or more executions by ID.
+    
+    Kill requests for multiple executions are sent concurrently.
+    """
+    try:
+        from ..api_client.executions import ExecutionsAPI
+        
+        # Initialize API client
+        client = get_client()
+        
+        # Create temporary context if credentials provided via CLI
+        context = build_temp_context(host, tenant, token)
+        
+        # Kill executions
+        executions_api = ExecutionsAPI(client)
+        errors = executions_api.kill_executions(execution_ids, tenant, context)
+        
+        if output == "json":
+            print_json([
+                {"id": execution_id, "killed": error is None, "error": str(error) if error else None}
+                for execution_id, error in zip(execution_ids, errors)
+            ])
+        else:
+            lines = []
+            for execution_id, error in zip(execution_ids, errors):
+                if error is None:
+                    lines.append(Text(f"✓ Kill request sent for {execution_id}", style=GREEN))
+                else:
+                    lines.append(Text(f"✗ {execution_id}: {error}", style=RED))
+            console.print(Text("\n").join(lines))
+        
+        if any(errors):
+            raise typer.Exit(1)
+    
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
+
+@app.command()
+def run(
+    namespace: str = typer.Argument(..., help="Namespace of the flow"),
+    flow_id: str = typer.Argument(..., help="Flow ID to execute"),
+    wait: bool = typer.Option(False, "--wait", "-w", help="Wait for execution to complete"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format (table or json)")
+):
+    """Trigger a flow execution.
+    
+    This command triggers an execution of the specified flow. By default, it will
+    return immediately after triggering (fire and forget). Use --wait to wait for
+    the execution to complete.
+    """
+    try:
+        from ..api_client.executions import ExecutionsAPI
+        
+        # Initialize API client
+        client = get_client()
+        
+        # Create temporary context if credentials provided via CLI
+        context = build_temp_context(host, tenant, token)
+        
+        # Trigger execution
+        executions_api = ExecutionsAPI(client)
+        
+        if wait:
+            console.print(Text(f"Triggering execution of flow '{flow_id}' in namespace '{namespace}'...", style=CYAN))
+            console.print(Text("Waiting for execution to complete...", style=YELLOW))
+        
+        execution = executions_api.trigger_execution(
+            namespace=namespace,
+            flow_id=flow_id,
+            wait=wait,
+            tenant=tenant,
+            context=context
+        )
+        
+        if output == "json":
+            print_json(execution)
+        else:
+            # Display execution information
+            lines = [
+                Text("✓ Execution triggered successfully!", style=GREEN),
+                Text(),
+                field("Execution ID", execution.get('id', 'N/A')),
+                field("Flow", execution.get('flowId', 'N/A')),
+                field("Namespace", execution.get('namespace', 'N/A')),
+                field("State", execution.get('state', {}).get('current', 'N/A')),
+            ]
+            
+            if 'startDate' in execution:
+                lines.append(field("Started", execution['startDate']))
+            
+            if wait and 'endDate' in execution:
+                lines.append(field("Ended", execution['endDate']))
+                
+                # Show duration if available
+                state_info = execution.get('state', {})
+                if 'duration' in state_info:
+                    duration_ms = state_info['duration']
+                    duration_sec = duration_ms / 1000
+                    lines.append(field("Duration", f"{duration_sec:.2f}s"))
+            
+            # Show URL if available
+            if 'url' in execution:
+                lines.append(field("URL", execution['url']))
+            
+            console.print(Text("\n").join(lines))
+    
+    except Exception as e:
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
+
+@app.command()
+def get(
+    execution_id: str = typer.Argument(..., help="Execution ID to retrieve"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format (table or json)")
+):
+    """Get execution details by ID.
+    
+    This command retrieves detailed information about a specific execution.
+    """
+    try:
+        from ..api_client.executions import ExecutionsAPI
+        
+        # Initialize API client
+        client = get_client()
+        
+        # Create temporary context if credentials provided via CLI
+        context = build_temp_context(host, tenant, token)
+        
+        # Get execution
+        executions_api = ExecutionsAPI(client)
+        execution = executions_api.get_execution(
+            execution_id=execution_id,
+            tenant=tenant,
+            context=context
+        )
+        
+        if output == "json":
+            print_json(execution)
+        else:
+            # Look up fields shown below and reused for the URL once
+            exec_id = execution.get('id')
+            exec_flow_id = execution.get('flowId')
+            exec_namespace = execution.get('namespace')
+            state_info = execution.get('state', {})
+            
+            # Display execution information
+            lines = [
+                Text("Execution Details", style=BOLD),
+                Text(),
+                field("Execution ID", 'N/A' if exec_id is None else exec_id),
+                field("Flow", 'N/A' if exec_flow_id is None else exec_flow_id),
+                field("Namespace", 'N/A' if exec_namespace is None else exec_namespace),
+                field("Flow Revision", execution.get('flowRevision', 'N/A')),
+                field("State", state_info.get('current', 'N/A')),
+            ]
+            
+            # Dates
+            if 'startDate' in state_info:
+                lines.append(field("Started", state_info['startDate']))
+            
+            if 'endDate' in state_info:
+                lines.append(field("Ended", state_info['endDate']))
+            
+            # Duration
+            if 'duration' in state_info:
+                duration_str = state_info['duration']
+                match = _PT_SECONDS_RE.match(duration_str) if isinstance(duration_str, str) else None
+                if match:
+                    duration_sec = float(match.group(1))
+                    lines.append(field("Duration", f"{duration_sec:.2f}s"))
+                else:
+                    lines.append(field("Duration", duration_str))
+            
+            # Labels
+            labels = execution.get('labels', [])
+            if labels:
+                lines.append(Text("Labels:", style=CYAN))
+                for label in labels:
+                    lines.append(Text(f"  • {label.get('key', 'N/A')}: {label.get('value', 'N/A')}"))
+            
+            # URL - construct if not provided
+            exec_url = execution.get('url')
+            if exec_url is not None:
+                lines.append(Text())
+                lines.append(field("URL", exec_url))
+            else:
+                # Construct URL from execution data
+                exec_context = context if context else executions_api.client.auth_manager.default_context
+                if exec_context and exec_id and exec_namespace and exec_flow_id:
+                    exec_tenant = tenant or exec_context.tenant
+                    exec_host = exec_context.host.rstrip('/')
+                    exec_url = f"{exec_host}/ui/{exec_tenant}/executions/{exec_namespace}/{exec_flow_id}/{exec_id}"
+                    lines.append(Text())
+                    lines.append(field("URL", exec_url))
+            
+            console.print(Text("\n").join(lines))
+    
+    except Exception as e:
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
+
+@app.command()
+def batch(
+    cmd: str = typer.Argument(..., help=f"Operation to run for each input line ({', '.join(_BATCH_METHODS)})"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name, for lines that don't set one"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token")
+):
+    """Run an operation for each JSON line read from stdin.
+    
+    Each line is a JSON object with the operation's arguments, for example
+    {"execution_id": "..."} for get and kill, or
+    {"namespace": "...", "flow_id": "..."} for run. Results are written to
+    stdout as JSON lines, in input order (null for a successful kill).
+    All lines share a single API client and its connection pool.
+    """
+    if cmd not in _BATCH_METHODS:
+        console.print(Text(f"Error: Unknown batch operation '{cmd}' (expected one of: {', '.join(_BATCH_METHODS)})", style=RED))
+        raise typer.Exit(1)
+    
+    from ..api_client.executions import ExecutionsAPI
+    
+    context = build_temp_context(host, tenant, token)
+    failures = run_batch(ExecutionsAPI(get_client()), _BATCH_METHODS, cmd, context, tenant)
+    
+    if failures:
+        raise typer.Exit(1)
@@ -2,23 +2,25 @@
 
 import typer
 from typing import Optional
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
-import json
+from rich.text import Text
 from pathlib import Path
 
-from src.api_client.client import KestraAPIClient
-from src.api_client.flows import FlowsAPI
-from src.api_client.auth import AuthContext
+from ._common import GREEN, RED, YELLOW, get_client, build_temp_context, field, print_json, run_batch
+from ._console import console
 
 
-console = Console()
 app = typer.Typer()
 
+# Operations accepted by `flows batch`, mapped to FlowsAPI methods
+_BATCH_METHODS = {
+    "get": "get_flow",
+    "list": "list_flows",
+    "deploy": "create_flow",
+}
 
-@app.command()
-def list(
+
+@app.command("list")
+def list_flows(
     namespace: str = typer.Argument(..., help="Namespace to list flows from"),
     tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
     host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
@@ -27,28 +29,24 @@ def list(
 ):
     """List flows in a namespace."""
     try:
+        from ..api_client.flows import FlowsAPI
+        
         # Initialize API client
-        client = KestraAPIClient()
+        client = get_client()
         
         # Create temporary context if credentials provided via CLI
-        context = None
-        if host or token:
-            from src.api_client.auth import AuthContext
-            context = AuthContext(
-                name="temp",
-                host=host or "http://localhost:8080",
-                tenant=tenant or "main",
-                auth_method="token",
-                token=token
-            )
+        context = build_temp_context(host, tenant, token)
         
-        # Get flows
         flows_api = FlowsAPI(client)
-        flows = flows_api.list_flows(namespace, tenant, context)
         
         if output == "json":
-            rprint(json.dumps(flows, indent=2))
+            # Get flows
+            flows = flows_api.list_flows(namespace, tenant, context)
+            print_json(flows)
         else:
+            from rich.live import Live
+            from rich.table import Table
+            
             # Create table
             table = Table(title=f"Flows in namespace '{namespace}'")
             table.add_column("ID", style="cyan")
@@ -56,18 +54,20 @@ def list(
             table.add_column("Description", style="green")
             table.add_column("Revision", style="yellow")
             
-            for flow in flows:
-                table.add_row(
-                    flow.get("id", ""),
-                    flow.get("namespace", ""),
-                    flow.get("description", ""),
-                    str(flow.get("revision", ""))
-                )
+            # Render rows as flows are received, then print the final table once
+            with Live(table, console=console, refresh_per_second=4, transient=True):
+                for flow in flows_api.list_flows_iter(namespace, tenant, context):
+                    table.add_row(
+                        flow.get("id", ""),
+                        flow.get("namespace", ""),
+                        flow.get("description", ""),
+                        str(flow.get("revision", ""))
+                    )
             
             console.print(table)
     
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        console.print(Text(f"Error: {e}", style=RED))
         raise typer.Exit(1)
 
 
@@ -82,42 +82,40 @@ def get(
 ):
     """Get a specific flow."""
     try:
+        from ..api_client.flows import FlowsAPI
+        
         # Initialize API client
-        client = KestraAPIClient()
+        client = get_client()
         
         # Create temporary context if credentials provided via CLI
-        context = None
-        if host or token:
-            from src.api_client.auth import AuthContext
-            context = AuthContext(
-                name="temp",
-                host=host or "http://localhost:8080",
-                tenant=tenant or "main",
-                auth_method="token",
-                token=token
-            )
+        context = build_temp_context(host, tenant, token)
         
         # Get flow
         flows_api = FlowsAPI(client)
         flow = flows_api.get_flow(namespace, flow_id, tenant, context)
         
         if output == "json":
-            rprint(json.dumps(flow, indent=2))
+            print_json(flow)
         else:
+            from rich.pretty import Pretty
+            from rich.table import Table
+            
             # Create table for flow details
             table = Table(title=f"Flow: {flow_id}")
             table.add_column("Property", style="cyan")
             table.add_column("Value", style="green")
             
             for key, value in flow.items():
+                # Nested structures are rendered lazily, with long lists abbreviated
                 if isinstance(value, (dict, list)):
-                    value = json.dumps(value, indent=2)
-                table.add_row(key, str(value))
+                    table.add_row(key, Pretty(value, max_length=10))
+                else:
+                    table.add_row(key, str(value))
             
             console.print(table)
     
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        console.print(Text(f"Error: {e}", style=RED))
         raise typer.Exit(1)
 
 
@@ -135,48 +133,69 @@ def deploy(
         # Check if file exists
         file_path = Path(filepath)
         if not file_path.exists():
-            console.print(f"[red]Error: File '{filepath}' not found[/red]")
+            console.print(Text(f"Error: File '{filepath}' not found", style=RED))
             raise typer.Exit(1)
         
         # Read YAML file
         try:
-            yaml_content = file_path.read_text()
+            yaml_content = file_path.read_bytes()
         except Exception as e:
-            console.print(f"[red]Error reading file: {e}[/red]")
+            console.print(Text(f"Error reading file: {e}", style=RED))
             raise typer.Exit(1)
         
+        from ..api_client.flows import FlowsAPI
+        
         # Initialize API client
-        client = KestraAPIClient()
+        client = get_client()
         
         # Create temporary context if credentials provided via CLI
-        context = None
-        if host or token:
-            from src.api_client.auth import AuthContext
-            context = AuthContext(
-                name="temp",
-                host=host or "http://localhost:8080",
-                tenant=tenant or "main",
-                auth_method="token",
-                token=token
-            )
+        context = build_temp_context(host, tenant, token)
         
         # Create flow
         flows_api = FlowsAPI(client)
         flow = flows_api.create_flow(yaml_content, tenant, context, override)
         
         if output == "json":
-            rprint(json.dumps(flow, indent=2))
+            print_json(flow)
         else:
             # Display success message with flow details
-            console.print(f"[green]✓ Flow deployed successfully![/green]")
-            console.print(f"[cyan]Flow ID:[/cyan] {flow.get('id', 'N/A')}")
-            console.print(f"[cyan]Namespace:[/cyan] {flow.get('namespace', 'N/A')}")
-            console.print(f"[cyan]Revision:[/cyan] {flow.get('revision', 'N/A')}")
+            console.print(Text("✓ Flow deployed successfully!", style=GREEN))
+            console.print(field("Flow ID", flow.get('id', 'N/A')))
+            console.print(field("Namespace", flow.get('namespace', 'N/A')))
+            console.print(field("Revision", flow.get('revision', 'N/A')))
     
     except ValueError as e:
         # Handle validation errors (like flow already exists)
-        console.print(f"[yellow]Warning: {e}[/yellow]")
+        console.print(Text(f"Warning: {e}", style=YELLOW))
         raise typer.Exit(1)
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
+
+@app.command()
+def batch(
+    cmd: str = typer.Argument(..., help=f"Operation to run for each input line ({', '.join(_BATCH_METHODS)})"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name, for lines that don't set one"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token")
+):
+    """Run an operation for each JSON line read from stdin.
+    
+    Each line is a JSON object with the operation's arguments, for example
+    {"namespace": "...", "flow_id": "..."} for get or
+    {"yaml_content": "...", "override": true} for deploy. Results are written
+    to stdout as JSON lines, in input order. All lines share a single API
+    client and its connection pool.
+    """
+    if cmd not in _BATCH_METHODS:
+        console.print(Text(f"Error: Unknown batch operation '{cmd}' (expected one of: {', '.join(_BATCH_METHODS)})", style=RED))
+        raise typer.Exit(1)
+    
+    from ..api_client.flows import FlowsAPI
+    
+    context = build_temp_context(host, tenant, token)
+    failures = run_batch(FlowsAPI(get_client()), _BATCH_METHODS, cmd, context, tenant)
+    
+    if failures:
         raise typer.Exit(1)
@@ -0,0 +1,67 @@
+"""CLI commands for namespaces."""
+
+import typer
+from typing import Optional
+from rich.text import Text
+
+from ._common import DIM, RED, get_client, build_temp_context, print_json
+from ._console import console
+
+
+app = typer.Typer()
+
+
+@app.command("list")
+def list_namespaces(
+    query: Optional[str] = typer.Option(None, "--query", "-q", help="Filter namespaces by search query"),
+    tenant: Optional[str] = typer.Option(None, "--tenant", "-t", help="Tenant name"),
+    host: Optional[str] = typer.Option(None, "--host", help="Kestra host URL"),
+    token: Optional[str] = typer.Option(None, "--token", help="API token"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format (table or json)")
+):
+    """List all namespaces in the Kestra instance."""
+    try:
+        from ..api_client.namespaces import NamespacesAPI
+        
+        # Initialize API client
+        client = get_client()
+        
+        # Create temporary context if credentials provided via CLI
+        context = build_temp_context(host, tenant, token)
+        
+        # Get namespaces, following pagination
+        namespaces_api = NamespacesAPI(client)
+        namespaces = namespaces_api.iter_namespaces(tenant, context, query=query)
+        
+        if output == "json":
+            print_json(list(namespaces))
+        else:
+            from rich.live import Live
+            from rich.table import Table
+            
+            # Create table
+            table = Table(title="Namespaces")
+            table.add_column("ID", style="cyan")
+            table.add_column("Deleted", style="yellow")
+            
+            # Render rows as pages are received, then print the final table once
+            with Live(table, console=console, refresh_per_second=4, transient=True):
+                for namespace in namespaces:
+                    # Handle both string format and dictionary format
+                    if isinstance(namespace, str):
+                        table.add_row(namespace, "false")
+                    else:
+                        deleted_status = "true" if namespace.get("deleted", False) else "false"
+                        table.add_row(
+                            namespace.get("id", ""),
+                            deleted_status
+                        )
+            
+            console.print(table)
+            console.print()
+            console.print(Text(f"Total namespaces: {table.row_count}", style=DIM))
+    
+    except Exception as e:
+        console.print(Text(f"Error: {e}", style=RED))
+        raise typer.Exit(1)
+
@@ -1,13 +1,14 @@
 """Main CLI entrypoint for Kestra CLI."""
 
 import typer
-from rich.console import Console
+from rich.text import Text
 
-from src.cli.flows import app as flows_app
-from src.cli.namespaces import app as namespaces_app
-from src.cli.executions import app as executions_app
+from .cli.flows import app as flows_app
+from .cli.namespaces import app as namespaces_app
+from .cli.executions import app as executions_app
+from .cli._common import BOLD, GREEN, RED, YELLOW
+from .cli._console import console
 
-console = Console()
 
 # Create the main Typer app
 app = typer.Typer(
@@ -33,20 +34,20 @@ config_app = typer.Typer(help="Manage configuration and authentication")
 @config_app.command()
 def show():
     """Show current configuration."""
-    from src.api_client.auth import AuthManager
+    from .api_client.auth import get_default_auth_manager
     
-    auth_manager = AuthManager()
+    auth_manager = get_default_auth_manager()
     
     # Show current configuration
     contexts = auth_manager.list_contexts()
-    default_context = auth_manager.get_context()
+    default_context = auth_manager.default_context
     
     if not contexts:
-        console.print("[yellow]No authentication contexts configured.[/yellow]")
+        console.print(Text("No authentication contexts configured.", style=YELLOW))
         console.print("Use 'config add' to add a new context.")
         return
     
-    console.print("[bold]Current Configuration:[/bold]")
+    console.print(Text("Current Configuration:", style=BOLD))
     console.print(f"Default context: {default_context.name if default_context else 'None'}")
     console.print()
     
@@ -63,9 +64,9 @@ def add(
     set_default: bool = typer.Option(False, "--default", help="Set as default context")
 ):
     """Add a new authentication context."""
-    from src.api_client.auth import AuthManager, AuthContext
+    from .api_client.auth import AuthContext, get_default_auth_manager
     
-    auth_manager = AuthManager()
+    auth_manager = get_default_auth_manager()
     
     # Create context
     context = AuthContext(
@@ -81,9 +82,9 @@ def add(
     
     if set_default:
         auth_manager.set_default_context(name)
-        console.print(f"[green]Context '{name}' added and set as default.[/green]")
+        console.print(Text(f"Context '{name}' added and set as default.", style=GREEN))
     else:
-        console.print(f"[green]Context '{name}' added.[/green]")
+        console.print(Text(f"Context '{name}' added.", style=GREEN))
     
     console.print(f"Host: {host}")
     console.print(f"Tenant: {tenant}")
@@ -94,15 +95,15 @@ def remove(
     name: str = typer.Argument(..., help="Context name to remove")
 ):
     """Remove an authentication context."""
-    from src.api_client.auth import AuthManager
+    from .api_client.auth import get_default_auth_manager
     
-    auth_manager = AuthManager()
+    auth_manager = get_default_auth_manager()
     
     try:
         auth_manager.delete_context(name)
-        console.print(f"[green]Context '{name}' removed.[/green]")
+        console.print(Text(f"Context '{name}' removed.", style=GREEN))
     except KeyError:
-        console.print(f"[red]Context '{name}' not found.[/red]")
+        console.print(Text(f"Context '{name}' not found.", style=RED))
         raise typer.Exit(1)
 
 @config_app.command()
@@ -110,15 +111,15 @@ def use(
     name: str = typer.Argument(..., help="Context name to use as default")
 ):
     """Set a context as the default."""
-    from src.api_client.auth import AuthManager
+    from .api_client.auth import get_default_auth_manager
     
-    auth_manager = AuthManager()
+    auth_manager = get_default_auth_manager()
     
     try:
         auth_manager.set_default_context(name)
-        console.print(f"[green]Default context set to '{name}'.[/green]")
+        console.print(Text(f"Default context set to '{name}'.", style=GREEN))
     except ValueError as e:
-        console.print(f"[red]{e}[/red]")
+        console.print(Text(str(e), style=RED))
         raise typer.Exit(1)
 
 # Add config subcommand to main app
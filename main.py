@@ -1,6 +1,6 @@
 """Main entrypoint for Kestra CLI."""
 
-from src.main_cli import app
+from kestra_cli.main_cli import app
 
 if __name__ == "__main__":
     app()
@@ -0,0 +1,54 @@
+"""Tests for the API client retry policy."""
+
+import pytest
+import httpx
+
+from kestra_cli.api_client.client import _RETRY_TOTAL, _retry_delay, _should_retry
+
+
+def _exchange(method: str, status: int, headers=None):
+    request = httpx.Request(method, "http://kestra.test/api/v1/main/flows")
+    return request, httpx.Response(status, headers=headers, request=request)
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD", "PUT", "DELETE"])
+@pytest.mark.parametrize("status", [429, 502, 503, 504])
+def test_idempotent_methods_retry_transient_statuses(method, status):
+    assert _should_retry(*_exchange(method, status), attempt=0)
+
+
+@pytest.mark.parametrize("status", [200, 400, 404, 409, 500])
+def test_non_transient_statuses_are_not_retried(status):
+    assert not _should_retry(*_exchange("GET", status), attempt=0)
+
+
+@pytest.mark.parametrize("status, headers, expected", [
+    (429, None, True),
+    (503, {"Retry-After": "1"}, True),
+    (503, None, False),
+    (502, None, False),
+    (504, None, False),
+    (502, {"Retry-After": "1"}, False),
+])
+def test_post_is_only_retried_when_not_processed(status, headers, expected):
+    assert _should_retry(*_exchange("POST", status, headers), attempt=0) is expected
+
+
+def test_other_methods_are_not_retried():
+    assert not _should_retry(*_exchange("PATCH", 503), attempt=0)
+
+
+def test_retries_stop_after_total():
+    assert _should_retry(*_exchange("GET", 503), attempt=_RETRY_TOTAL - 1)
+    assert not _should_retry(*_exchange("GET", 503), attempt=_RETRY_TOTAL)
+
+
+def test_long_retry_after_is_not_retried():
+    assert not _should_retry(*_exchange("GET", 429, {"Retry-After": "3600"}), attempt=0)
+    assert not _should_retry(*_exchange("POST", 503, {"Retry-After": "3600"}), attempt=0)
+
+
+def test_retry_delay_honours_retry_after_and_is_capped():
+    assert _retry_delay(0, _exchange("GET", 429, {"Retry-After": "2"})[1]) == 2.0
+    assert _retry_delay(0, _exchange("GET", 429, {"Retry-After": "3600"})[1]) == 30.0
+    assert _retry_delay(2, _exchange("GET", 503)[1]) == 2.0
@@ -0,0 +1,66 @@
+"""Tests for flow YAML parsing."""
+
+import pytest
+import yaml
+
+from kestra_cli.api_client.flows import _prescan_flow_yaml, parse_flow_yaml
+
+
+def _parse_with_yaml(content):
+    """Reference result: what a full YAML parse yields for parse_flow_yaml."""
+    data = yaml.safe_load(content)
+    if not data.get("id"):
+        raise ValueError("Flow YAML must contain an 'id' field")
+    if not data.get("namespace"):
+        raise ValueError("Flow YAML must contain a 'namespace' field")
+    return data["namespace"], data["id"]
+
+
+CASES = {
+    "plain": "id: hello\nnamespace: company.team\n",
+    "comment": "id: hello  # the flow\nnamespace: company.team\n",
+    "hash-in-value": "id: hello#x\nnamespace: company.team\n",
+    "trailing-space": "id: hello  \nnamespace: company.team\n",
+    "crlf": "id: hello\r\nnamespace: company.team\r\ntasks: []\r\n",
+    "double-quoted": 'id: "hello"\nnamespace: "company.team"\n',
+    "single-quoted": "id: 'hello'\nnamespace: 'company.team'\n",
+    "quoted-number": 'id: "012"\nnamespace: company.team\n',
+    "leading-zero": "id: 012\nnamespace: company.team\n",
+    "underscore-int": "id: 1_000\nnamespace: company.team\n",
+    "float": "id: 1.50\nnamespace: company.team\n",
+    "int": "id: 10\nnamespace: company.team\n",
+    "date": "id: 2024-01-01\nnamespace: company.team\n",
+    "digit-start-string": "id: 1st-flow\nnamespace: company.team\n",
+    "bool": "id: hello\nnamespace: yes\n",
+    "null": "id: null\nnamespace: company.team\n",
+    "tilde": "id: ~\nnamespace: company.team\n",
+    "duplicate-key": "id: first\nnamespace: company.team\nid: second\n",
+    "nested-id": "namespace: company.team\ntasks:\n  - id: task\nid: hello\n",
+    "missing-namespace": "id: hello\n",
+}
+
+
+@pytest.mark.parametrize("as_bytes", [False, True], ids=["str", "bytes"])
+@pytest.mark.parametrize("content", CASES.values(), ids=CASES.keys())
+def test_parse_flow_yaml_matches_full_yaml_parse(content, as_bytes):
+    if as_bytes:
+        content = content.encode()
+    
+    try:
+        expected = _parse_with_yaml(content)
+    except ValueError as e:
+        with pytest.raises(ValueError, match=str(e)):
+            parse_flow_yaml(content)
+    else:
+        assert parse_flow_yaml(content) == expected
+
+
+@pytest.mark.parametrize("content", [CASES["plain"], CASES["crlf"], CASES["comment"]])
+def test_prescan_handles_simple_flows(content):
+    assert _prescan_flow_yaml(content) == ("company.team", "hello")
+    assert _prescan_flow_yaml(content.encode()) == ("company.team", "hello")
+
+
+@pytest.mark.parametrize("name", ["hash-in-value", "leading-zero", "underscore-int", "float", "date", "bool", "null", "duplicate-key"])
+def test_prescan_defers_ambiguous_values_to_yaml(name):
+    assert _prescan_flow_yaml(CASES[name]) is None